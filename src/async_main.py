@@ -0,0 +1,608 @@
+"""Asynchronous automatic speech recognition pipeline.
+
+Pseudo-code for the event-loop driven variant of the pipeline in main.py.
+Audio arrives in chunks, is accumulated per session and is transcribed by
+a speech recognition model chunk by chunk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from os import urandom
+from queue import Empty, LifoQueue
+from threading import Lock
+from typing import TypeVar
+from zlib import crc32
+
+from src.placeholders import some_bytes, some_string
+
+_ItemT = TypeVar('_ItemT')
+
+
+def _drain(source: list[_ItemT], amount: int | None = None) -> list[_ItemT]:
+    """Empty a list with two C-level operations.
+
+    A slice copy plus clear runs no per-element Python bytecode, unlike
+    a pop-per-element loop.
+
+    Args:
+        source (list): list to empty.
+        amount (int | None): amount of filled elements to keep, all by
+            default.
+
+    Returns:
+        list: drained elements, oldest first.
+    """
+    drained: list[_ItemT] = source[:amount]
+    source.clear()
+    return drained
+
+
+class AudioBufferPool:
+    """Process-wide pool of reusable audio chunk buffers."""
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        self._buffers: dict[int, LifoQueue[bytearray]] = {}
+        self._lock: Lock = Lock()
+
+    def acquire(self, size: int) -> bytearray:
+        """Get a buffer of the requested size, reusing one if possible.
+
+        Args:
+            size (int): buffer size in bytes.
+
+        Returns:
+            bytearray: recycled or freshly allocated buffer.
+        """
+        with self._lock:
+            stack = self._buffers.get(size)
+
+        if stack is not None:
+            try:
+                return stack.get_nowait()
+            except Empty:
+                return bytearray(size)
+
+        return bytearray(size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer to the pool for reuse.
+
+        Args:
+            buffer (bytearray): buffer that is no longer referenced.
+        """
+        with self._lock:
+            stack = self._buffers.setdefault(len(buffer), LifoQueue())
+
+        stack.put_nowait(buffer)
+
+
+# Domain
+class IdentifierEntity:
+    """Identifier entity.
+
+    String form of a session identifier, for serialization boundaries
+    only; internally sessions are keyed by 64-bit integers.
+    """
+
+    __slots__ = ('_id',)
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        self._id: str = self._create_uuid()
+
+    @property
+    def id(self) -> str:  # noqa: WPS125
+        """Get identifier.
+
+        Returns:
+            str: identifier.
+        """
+        return self._id
+
+    def _create_uuid(self) -> str:
+        # Only collision resistance is needed here, not RFC 4122
+        # formatting, and raw urandom bytes skip the version and
+        # variant bit-twiddling of uuid4.
+        return urandom(16).hex()
+
+
+class AudioEntity:
+    """Audio entity."""
+
+    __slots__ = ('_audio_data',)
+
+    def __init__(self, audio_data: bytearray) -> None:
+        """Create new instance.
+
+        Args:
+            audio_data (bytearray): bytes of audio.
+        """
+        self._audio_data: bytearray = audio_data
+
+    @property
+    def audio_data(self) -> bytearray:
+        """Get bytes of audio.
+
+        Returns:
+            bytearray: bytes of audio.
+        """
+        return self._audio_data
+
+    def release(self) -> None:
+        """Return the underlying buffer to the pool.
+
+        Must only be called once the audio data is fully consumed.
+        """
+        _audio_buffer_pool.release(self._audio_data)
+
+
+class TranscriptionEntity:
+    """Transcription entity."""
+
+    __slots__ = ('_start', '_end', '_text')
+
+    def __init__(self, start: int, end: int, text: str) -> None:
+        """Create new instance.
+
+        Args:
+            start (int): start of the utterance, in milliseconds.
+            end (int): end of the utterance, in milliseconds.
+            text (str): recognized text.
+        """
+        self._start: int = start
+        self._end: int = end
+        self._text: str = text
+
+    @property
+    def start(self) -> int:
+        """Get start of the utterance.
+
+        Returns:
+            int: start of the utterance, in milliseconds.
+        """
+        return self._start
+
+    @property
+    def end(self) -> int:
+        """Get end of the utterance.
+
+        Returns:
+            int: end of the utterance, in milliseconds.
+        """
+        return self._end
+
+    @property
+    def text(self) -> str:
+        """Get recognized text.
+
+        Returns:
+            str: recognized text.
+        """
+        return self._text
+
+
+class AudioQueueService:
+    """Audio queue service."""
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        self._audio_queue: bytearray = bytearray(some_bytes)
+        self._sample_rate: int = 16000
+        self._bytes_per_sample: int = 2
+
+        # The audio format is fixed for the session lifetime, so the
+        # milliseconds-to-bytes factor is computed once instead of on
+        # every dequeue.
+        self._bytes_per_millisecond: int = (
+            self._sample_rate * self._bytes_per_sample
+        ) // 1000
+
+        # The queue only keeps a confirmed prefix plus the still
+        # unconfirmed tail; everything before the read position has been
+        # handed out, everything before the confirmed position may be
+        # trimmed.
+        self._read_offset_bytes: int = 0
+        self._confirmed_offset_bytes: int = 0
+
+    def not_empty(self) -> bool:
+        """Check that queue is not empty.
+
+        A plain memory read; making it a coroutine would cost an
+        awaitable per loop iteration in the processing hot path.
+
+        Returns:
+            bool: True if queue holds unread audio.
+        """
+        return len(self._audio_queue) > self._read_offset_bytes
+
+    async def enqueue(self, audio: AudioEntity) -> None:
+        """Enqueue audio.
+
+        Appends in place, so a long session never re-copies the audio
+        that was already accumulated.
+
+        Args:
+            audio (AudioEntity): audio entity.
+        """
+        self._audio_queue.extend(audio.audio_data)
+
+    async def dequeue(self, duration_in_milliseconds: int) -> AudioEntity:
+        """Dequeue audio chunk.
+
+        Args:
+            duration_in_milliseconds (int): chunk duration.
+
+        Returns:
+            AudioEntity: audio entity with at most the requested duration.
+        """
+        chunk_size: int = min(
+            duration_in_milliseconds * self._bytes_per_millisecond,
+            len(self._audio_queue) - self._read_offset_bytes,
+        )
+        chunk: bytearray = _audio_buffer_pool.acquire(chunk_size)
+
+        # Slicing through a memoryview copies straight into the pooled
+        # buffer, without an intermediate bytearray for the slice.
+        chunk[:] = memoryview(self._audio_queue)[
+            self._read_offset_bytes:self._read_offset_bytes + chunk_size
+        ]
+        self._read_offset_bytes += chunk_size
+
+        return AudioEntity(chunk)
+
+    async def confirm(self, duration_in_milliseconds: int) -> None:
+        """Confirm transcribed audio and trim the confirmed prefix.
+
+        Audio stays in the queue until confirmed, so a streaming
+        consumer can rewind and refeed the unconfirmed tail; only the
+        tail is ever kept in memory.
+
+        Args:
+            duration_in_milliseconds (int): confirmed duration.
+        """
+        self._confirmed_offset_bytes = min(
+            self._confirmed_offset_bytes
+            + duration_in_milliseconds * self._bytes_per_millisecond,
+            self._read_offset_bytes,
+        )
+
+        # Trimming on every confirm would move the whole tail each
+        # time; compacting only once the confirmed prefix outgrows the
+        # tail keeps the cost amortized O(1) per byte.
+        if self._confirmed_offset_bytes > len(self._audio_queue) // 2:
+            del self._audio_queue[  # noqa: WPS420
+                :self._confirmed_offset_bytes
+            ]
+            self._read_offset_bytes -= self._confirmed_offset_bytes
+            self._confirmed_offset_bytes = 0
+
+    async def rewind(self) -> None:
+        """Move the read position back to the confirmed prefix.
+
+        Lets a streaming consumer refeed the unconfirmed tail to the
+        model instead of growing chunks without bound.
+        """
+        self._read_offset_bytes = self._confirmed_offset_bytes
+
+
+class TranscriptionQueueService:
+    """Transcription queue service."""
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        self._transcription_queue: list[TranscriptionEntity] = []
+        self._write_index: int = 0
+
+    def not_empty(self) -> bool:
+        """Check that queue is not empty.
+
+        Returns:
+            bool: True if queue holds transcriptions.
+        """
+        return bool(self._write_index)
+
+    def reserve(self, amount: int) -> None:
+        """Preallocate room for an expected amount of transcriptions.
+
+        One up-front extend replaces the repeated doubling reallocations
+        of append-style growth when the chunk count is known in advance.
+
+        Args:
+            amount (int): expected amount of transcriptions.
+        """
+        missing: int = (
+            self._write_index + amount - len(self._transcription_queue)
+        )
+
+        if missing > 0:
+            self._transcription_queue.extend(
+                [_placeholder_transcription] * missing,
+            )
+
+    async def enqueue(self, transcriptions: list[TranscriptionEntity]) -> None:
+        """Enqueue transcriptions.
+
+        Writes into reserved slots with one C-level slice assignment
+        when capacity allows, extending otherwise.
+
+        Args:
+            transcriptions (list[TranscriptionEntity]): transcriptions.
+        """
+        end: int = self._write_index + len(transcriptions)
+
+        if end <= len(self._transcription_queue):
+            self._transcription_queue[self._write_index:end] = transcriptions
+        else:
+            del self._transcription_queue[self._write_index:]  # noqa: WPS420
+            self._transcription_queue.extend(transcriptions)
+
+        self._write_index = end
+
+    async def dequeue(self) -> list[TranscriptionEntity]:
+        """Dequeue all transcriptions.
+
+        Returns:
+            list[TranscriptionEntity]: transcriptions, oldest first.
+        """
+        drained: list[TranscriptionEntity] = _drain(
+            self._transcription_queue, self._write_index,
+        )
+        self._write_index = 0
+        return drained
+
+
+class AudioRecognitionService:
+    """Audio recognition service.
+
+    The model is loaded with int8 quantized weights: transcription is
+    the compute-bound hot path, and int8 halves the memory bandwidth of
+    the forward pass without changing the transcribe signature.
+
+    Results are memoized by a fingerprint of the audio content, so a
+    streaming consumer refeeding the unconfirmed tail gets the repeated
+    region back without another forward pass.
+    """
+
+    _compute_type: str = 'int8'
+    _cache_capacity: int = 128
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        self._cache: OrderedDict[int, str] = OrderedDict()
+
+    async def transcribe(self, audio: AudioEntity) -> str:
+        """Transcribe audio chunk.
+
+        Args:
+            audio (AudioEntity): audio entity.
+
+        Returns:
+            str: recognized text.
+        """
+        fingerprint: int = crc32(audio.audio_data)
+        cached: str | None = self._lookup(fingerprint)
+        if cached is not None:
+            audio.release()
+            return cached
+
+        text: str = await asyncio.to_thread(self._run_model, audio.audio_data)
+        audio.release()
+        self._remember(fingerprint, text)
+        return text
+
+    def _lookup(self, fingerprint: int) -> str | None:
+        cached: str | None = self._cache.get(fingerprint)
+        if cached is not None:
+            self._cache.move_to_end(fingerprint)
+        return cached
+
+    def _remember(self, fingerprint: int, text: str) -> None:
+        self._cache[fingerprint] = text
+        if len(self._cache) > self._cache_capacity:
+            self._cache.popitem(last=False)
+
+    def _run_model(self, audio_data: bytearray) -> str:
+        # Placeholder for the blocking quantized model call; to_thread
+        # above keeps it off the event loop.
+        return some_string
+
+
+# Chunks waiting for the next model batch, paired with the futures that
+# deliver their transcriptions.
+_BatchQueue = asyncio.Queue[tuple[AudioEntity, 'asyncio.Future[str]']]
+
+
+class BatchedAudioRecognitionService(AudioRecognitionService):
+    """Audio recognition service that batches chunks across sessions.
+
+    With many small sessions each chunk is tiny and per-call model
+    overhead dominates. Chunks from all sessions are gathered into one
+    batch, padded to the longest chunk and handed to the model as a
+    single forward pass.
+    """
+
+    _max_batch_size: int = 16
+    _max_wait_in_milliseconds: int = 20
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        super().__init__()
+        self._batch_queue: _BatchQueue = asyncio.Queue()
+        self._batch_worker: asyncio.Task[None] | None = None
+
+    async def transcribe(self, audio: AudioEntity) -> str:
+        """Transcribe audio chunk as part of the next batch.
+
+        Args:
+            audio (AudioEntity): audio entity.
+
+        Returns:
+            str: recognized text.
+        """
+        fingerprint: int = crc32(audio.audio_data)
+        cached: str | None = self._lookup(fingerprint)
+        if cached is not None:
+            audio.release()
+            return cached
+
+        if self._batch_worker is None:
+            self._batch_worker = asyncio.create_task(self._run_batches())
+
+        future: asyncio.Future[str] = (
+            asyncio.get_running_loop().create_future()
+        )
+        await self._batch_queue.put((audio, future))
+
+        text: str = await future
+        self._remember(fingerprint, text)
+        return text
+
+    async def _run_batches(self) -> None:
+        while True:
+            batch = [await self._batch_queue.get()]
+
+            # Wait a little for more chunks to arrive, but never longer
+            # than the latency budget.
+            while len(batch) < self._max_batch_size:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._batch_queue.get(),
+                        timeout=self._max_wait_in_milliseconds / 1000,
+                    ))
+                except TimeoutError:
+                    break
+
+            texts: list[str] = await self._transcribe_batch(
+                [audio for audio, _ in batch],
+            )
+            for (_, future), text in zip(batch, texts):
+                future.set_result(text)
+
+    async def _transcribe_batch(self, audios: list[AudioEntity]) -> list[str]:
+        texts: list[str] = await asyncio.to_thread(
+            self._run_model_batch,
+            [audio.audio_data for audio in audios],
+        )
+
+        for audio in audios:
+            audio.release()
+
+        return texts
+
+    def _run_model_batch(self, audio_data: list[bytearray]) -> list[str]:
+        # Placeholder for one padded quantized forward pass over the
+        # whole batch.
+        return [some_string for _ in audio_data]
+
+
+# Work queue of (sequence number, start in milliseconds, audio) chunks;
+# None tells a transcription worker to stop.
+_ChunkQueue = asyncio.Queue['tuple[int, int, AudioEntity] | None']
+
+
+class SessionEntity:
+    """Session entity."""
+
+    __slots__ = (
+        '_audio_queue',
+        '_transcription_queue',
+        '_audio_recognition',
+        '_position_in_milliseconds',
+    )
+
+    _chunk_duration_in_milliseconds: int = 1000
+    _max_concurrent_transcriptions: int = 4
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        self._audio_queue: AudioQueueService = AudioQueueService()
+        self._transcription_queue: TranscriptionQueueService = (
+            TranscriptionQueueService()
+        )
+        # Recognition is shared between all sessions, so their chunks
+        # end up in the same batches.
+        self._audio_recognition: AudioRecognitionService = (
+            _audio_recognition_service
+        )
+        self._position_in_milliseconds: int = 0
+
+    async def process(self) -> None:
+        """Process all queued audio.
+
+        Audio chunks are independent, so up to
+        _max_concurrent_transcriptions of them are transcribed at the
+        same time. Each chunk carries a sequence number; results are put
+        back in arrival order and enqueued as one batch, so the
+        transcription queue is written once instead of once per chunk.
+        """
+        chunks: _ChunkQueue = asyncio.Queue(
+            maxsize=self._max_concurrent_transcriptions,
+        )
+        transcribed: dict[int, TranscriptionEntity] = {}
+        sequence: int = 0
+
+        # The task group cancels the remaining workers if any of them
+        # fails, so no chunk task can outlive the drain.
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(self._max_concurrent_transcriptions):
+                task_group.create_task(
+                    self._transcribe_chunks(chunks, transcribed),
+                )
+
+            while self._audio_queue.not_empty():
+                audio: AudioEntity = await self._audio_queue.dequeue(
+                    self._chunk_duration_in_milliseconds,
+                )
+                start: int = self._position_in_milliseconds
+                self._position_in_milliseconds += (
+                    self._chunk_duration_in_milliseconds
+                )
+
+                # The bounded queue blocks here once
+                # _max_concurrent_transcriptions chunks are in flight.
+                await chunks.put((sequence, start, audio))
+                sequence += 1
+
+            for _ in range(self._max_concurrent_transcriptions):
+                await chunks.put(None)
+
+        await self._audio_queue.confirm(
+            sequence * self._chunk_duration_in_milliseconds,
+        )
+
+        if transcribed:
+            self._transcription_queue.reserve(len(transcribed))
+            await self._transcription_queue.enqueue(
+                [transcribed[seq] for seq in range(sequence)],
+            )
+
+    async def _transcribe_chunks(
+        self,
+        chunks: _ChunkQueue,
+        transcribed: dict[int, TranscriptionEntity],
+    ) -> None:
+        while True:
+            chunk: tuple[int, int, AudioEntity] | None = await chunks.get()
+            if chunk is None:
+                return
+
+            sequence, start, audio = chunk
+            text: str = await self._audio_recognition.transcribe(audio)
+            transcribed[sequence] = TranscriptionEntity(
+                start, start + self._chunk_duration_in_milliseconds, text,
+            )
+
+
+_audio_buffer_pool: AudioBufferPool = AudioBufferPool()
+
+# Filler for reserved transcription slots; never handed out, since
+# dequeue only returns the written prefix.
+_placeholder_transcription: TranscriptionEntity = TranscriptionEntity(
+    0, 0, some_string,
+)
+_audio_recognition_service: BatchedAudioRecognitionService = (
+    BatchedAudioRecognitionService()
+)
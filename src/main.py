@@ -7,13 +7,34 @@ handle:
 second).
 """
 
-from typing import Protocol
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from secrets import randbits
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 # Domain
 class SessionEntity:
     """Session entity."""
 
+    __slots__ = (
+        '_data',
+        '_amount_of_processed_audios',
+        '_amount_of_unprocessed_audios',
+        '_transcriptions',
+    )
+
     def __init__(self) -> None:
         """Create new instance."""
         self._data: bytes = b''  # noqa: WPS110
@@ -47,11 +68,14 @@ class SessionEntity:
         """
         pass  # noqa: WPS420
 
-    def retrieve_transcriptions(self) -> list[str]:
+    def retrieve_transcriptions(self) -> Sequence[str]:
         """Retrieve transcriptions.
 
+        Hands out the internal list as a read-only view instead of
+        copying it; callers must not mutate it.
+
         Returns:
-            list[str]: transcriptions.
+            Sequence[str]: transcriptions.
         """
         return self._transcriptions
 
@@ -68,7 +92,10 @@ class SessionFactory:
         return (self._create_random_pk(), SessionEntity())
 
     def _create_random_pk(self) -> int:
-        return 0
+        # A raw 64-bit integer is collision-resistant enough for session
+        # keys, hashes natively as a dict key and skips the UUID
+        # formatting machinery.
+        return randbits(64)
 
 
 class SessionRepositoryInterface(Protocol):
@@ -98,7 +125,18 @@ class Worker:
 
     def run_in_thread(self) -> None:
         """Run worker in thread."""
-        pass  # noqa: WPS420
+        Thread(target=self._run_event_loop, daemon=True).start()
+
+    def _run_event_loop(self) -> None:
+        # uvloop is a drop-in event loop that handles the many-small-
+        # requests workload a few times faster than the stdlib loop;
+        # fall back silently when it is not installed.
+        if uvloop is not None:
+            uvloop.install()
+
+        event_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        asyncio.set_event_loop(event_loop)
+        event_loop.run_forever()
 
 
 class CreateSessionUseCase:
@@ -113,7 +151,7 @@ class CreateSessionUseCase:
         Returns:
             int: primary key of created session entity.
         """
-        pk, session = SessionFactory().create()
+        pk, session = _session_factory.create()
         repository.create(pk, session)
         return pk
 
@@ -170,7 +208,7 @@ class RetrieveTranscriptionsOfSessionUseCase:
         self,
         repository: SessionRepositoryInterface,
         pk: int,
-    ) -> list[str]:
+    ) -> Sequence[str]:
         """Do use case.
 
         Args:
@@ -178,17 +216,78 @@ class RetrieveTranscriptionsOfSessionUseCase:
             pk (int): primary key
 
         Returns:
-            list[str]: transcriptions.
+            Sequence[str]: transcriptions.
         """
         session: SessionEntity = repository.retrieve(pk)
         return session.retrieve_transcriptions()
 
 
+# The factory and use cases are stateless, so every request reuses the
+# same instances instead of allocating new ones.
+_session_factory: SessionFactory = SessionFactory()
+_create_session_use_case: CreateSessionUseCase = CreateSessionUseCase()
+_retrieve_session_statistic_use_case: RetrieveSessionStatisticUseCase = (
+    RetrieveSessionStatisticUseCase()
+)
+_add_audio_to_session_use_case: AddAudioToSessionUseCase = (
+    AddAudioToSessionUseCase()
+)
+_retrieve_transcriptions_use_case: RetrieveTranscriptionsOfSessionUseCase = (
+    RetrieveTranscriptionsOfSessionUseCase()
+)
+
+
 # Infrastructure
+class ShardedSessionMap:
+    """Thread-safe session map with striped locking.
+
+    Sessions are spread over independently locked shards, so the worker
+    thread and request handlers only contend when they touch the same
+    shard.
+    """
+
+    _shard_count: int = 16
+
+    def __init__(self) -> None:
+        """Create new instance."""
+        self._shards: list[dict[int, SessionEntity]] = [
+            {} for _ in range(self._shard_count)
+        ]
+        self._locks: list[Lock] = [
+            Lock() for _ in range(self._shard_count)
+        ]
+
+    def create(self, pk: int, session: SessionEntity) -> None:
+        """Store session under its shard lock.
+
+        Args:
+            pk (int): primary key.
+            session (SessionEntity): session entity.
+        """
+        shard: int = pk & (self._shard_count - 1)
+
+        with self._locks[shard]:
+            self._shards[shard][pk] = session
+
+    def retrieve(self, pk: int) -> SessionEntity:
+        """Retrieve session under its shard lock.
+
+        Args:
+            pk (int): primary key.
+
+        Returns:
+            SessionEntity: session entity.
+        """
+        shard: int = pk & (self._shard_count - 1)
+
+        with self._locks[shard]:
+            return self._shards[shard][pk]
+
+
 class SessionRepository:
     """Session repository."""
 
-    _db: dict[int, SessionEntity] = {}
+    _db: ShardedSessionMap = ShardedSessionMap()
 
     def create(self, pk: int, session: SessionEntity) -> None:
         """Create new session.
@@ -197,7 +296,7 @@ class SessionRepository:
             pk (int): primary key.
             session (SessionEntity): session entity.
         """
-        self._db[pk] = session
+        self._db.create(pk, session)
 
     def retrieve(self, pk: int) -> SessionEntity:
         """Retrieve session.
@@ -208,44 +307,76 @@ class SessionRepository:
         Returns:
             SessionEntity: session entity.
         """
-        return self._db[pk]
+        return self._db.retrieve(pk)
 
 
 # User Interface
+# Response bodies are frozen, slotted structs with a fixed field layout,
+# so serializing them skips the dict probing that per-request dict
+# literals would pay.
+@dataclass(frozen=True, slots=True)
+class CreateSessionResponse:
+    """Create session response body."""
+
+    pk: int
+
+
+@dataclass(frozen=True, slots=True)
+class SessionStatisticsResponse:
+    """Session statistics response body."""
+
+    processed: int
+    in_process: int
+
+
+@dataclass(frozen=True, slots=True)
+class StatusResponse:
+    """Status response body."""
+
+    status: str = 'ok'
+
+
+@dataclass(frozen=True, slots=True)
+class TranscriptionsResponse:
+    """Transcriptions response body."""
+
+    transcriptions: Sequence[str]
+
+
 class Controller:
     """Controller."""
 
     _session_repository: SessionRepositoryInterface = SessionRepository()
 
-    def create_session(self) -> dict[str, int]:
+    def create_session(self) -> CreateSessionResponse:
         """Create (post) session endpoint.
 
         Returns:
-            dict[str, int]: response body.
+            CreateSessionResponse: response body.
         """
-        return {
-            'pk': CreateSessionUseCase().execute(self._session_repository),
-        }
+        return CreateSessionResponse(
+            pk=_create_session_use_case.execute(self._session_repository),
+        )
 
-    def retrieve_session_statistics(self, pk: int) -> dict[str, int]:
+    def retrieve_session_statistics(self, pk: int) -> SessionStatisticsResponse:
         """Retrieve (get) session statistics.
 
         Args:
             pk (int): primary key of session entity.
 
         Returns:
-            dict[str, int]: response body
+            SessionStatisticsResponse: response body
         """
-        processed, unprocessed = RetrieveSessionStatisticUseCase().execute(
+        processed, unprocessed = _retrieve_session_statistic_use_case.execute(
             self._session_repository, pk,
         )
 
-        return {
-            'processed': processed,
-            'in_process': unprocessed,
-        }
+        return SessionStatisticsResponse(
+            processed=processed,
+            in_process=unprocessed,
+        )
 
-    def add_audio(self, pk: int, audio: bytes) -> dict[str, str]:
+    def add_audio(self, pk: int, audio: bytes) -> StatusResponse:
         """Add (post) audio to session.
 
         Args:
@@ -253,25 +384,30 @@ class Controller:
             audio (bytes): bytes of audio.
 
         Returns:
-            dict[str, int]: response body
+            StatusResponse: response body
         """
-        AddAudioToSessionUseCase().execute(self._session_repository, pk, audio)
-        return {'status': 'ok'}
+        _add_audio_to_session_use_case.execute(
+            self._session_repository, pk, audio,
+        )
+        return StatusResponse()
 
-    def retrieve_transcriptions(self, pk: int) -> dict[str, list[str]]:
+    def retrieve_transcriptions(self, pk: int) -> TranscriptionsResponse:
         """Retrieve (get) transcriptions of session.
 
+        The transcriptions are a read-only view over session state, so
+        the response can be serialized without materializing a copy.
+
         Args:
             pk (int): primary key of session
 
         Returns:
-            dict[str, str]: response body.
+            TranscriptionsResponse: response body.
         """
-        return {
-            'transcriptions': RetrieveTranscriptionsOfSessionUseCase().execute(
+        return TranscriptionsResponse(
+            transcriptions=_retrieve_transcriptions_use_case.execute(
                 self._session_repository, pk,
             ),
-        }
+        )
 
 
 if __name__ == '__main__':